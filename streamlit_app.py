@@ -1,21 +1,466 @@
 import streamlit as st
 from gnews import GNews
+from gnews.utils.constants import USER_AGENT, GOOGLE_NEWS_REGEX
+from gnews.utils.utils import resolve_url
+import feedparser
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
 import logging
+from logging.handlers import MemoryHandler
 from datetime import datetime, timedelta
 import sys
 from io import BytesIO
+import xlsxwriter
 import json  # Ensure json is imported
+import html
+import re
+import asyncio
+import threading
+import sqlite3
+import pickle
+import hashlib
+import time
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    STRING_DTYPE = 'string[pyarrow]'
+except ImportError:
+    pa = None
+    STRING_DTYPE = 'string'
+
+# Markup stripping for RSS item descriptions
+SCRIPT_STYLE_RE = re.compile(r'<(script|style)\b.*?</\1\s*>', flags=re.S | re.I)
+TAG_RE = re.compile(r'<[^>]+>')
+
+# orjson decodes small JSON documents several times faster than the stdlib;
+# its JSONDecodeError subclasses json.JSONDecodeError, so error handling is unchanged
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+LOG_FORMAT = '%(asctime)s [%(levelname)s] %(message)s'
+
+# Configure logging once per process. Streamlit re-executes this module on every rerun,
+# and building the handlers again would open app.log anew each time even though
+# basicConfig ignores them once the root logger is configured.
+if not logging.getLogger().handlers:
+    log_formatter = logging.Formatter(LOG_FORMAT)
+    # Open app.log lazily and write it in batches, flushing straight away on errors
+    file_handler = logging.FileHandler("app.log", delay=True)
+    file_handler.setFormatter(log_formatter)
+    logging.basicConfig(
+        level=logging.INFO,
+        format=LOG_FORMAT,
+        handlers=[
+            MemoryHandler(capacity=100, flushLevel=logging.ERROR, target=file_handler),
+            logging.StreamHandler(sys.stdout)
+        ]
+    )
+
+# Sidebar defaults, and the popular queries prefetched in the background at startup
+DEFAULT_QUERY = "Artificial Intelligence"
+DEFAULT_MAX_RESULTS = 10
+WARM_QUERIES = (DEFAULT_QUERY, "Technology", "Finance")
+
+# Format of the 'published date' strings in Google News RSS items, e.g. "Mon, 01 Jan 2024 10:00:00 GMT"
+RSS_DATE_FORMAT = '%a, %d %b %Y %H:%M:%S %Z'
+
+# Columns of a GNews result that the app uses; anything else is dropped right after fetching
+GNEWS_COLUMNS = ('title', 'description', 'published date', 'url', 'publisher')
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s [%(levelname)s] %(message)s',
-    handlers=[
-        logging.FileHandler("app.log"),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+# Google News article links are JavaScript redirects that only a headless browser can
+# follow; without playwright, GNews leaves them as they are
+PLAYWRIGHT_AVAILABLE = find_spec('playwright') is not None
+# Headless browsers resolving article links at once, across all concurrent scrapes
+URL_RESOLVE_WORKERS = 4
+
+# On-disk scrape cache, so identical queries survive app restarts.
+# SCRAPE_CACHE_TTL bounds how stale a served result can be; the in-memory layer keeps
+# entries for SCRAPE_MEMORY_TTL, so the disk layer only serves what it has left.
+SCRAPE_CACHE_PATH = "scrape_cache.db"
+SCRAPE_CACHE_TTL = 1800
+SCRAPE_MEMORY_TTL = 600
+
+def _open_scrape_cache() -> sqlite3.Connection:
+    """
+    Opens the on-disk scrape cache, creating its table if needed. A short-lived
+    connection per operation keeps access safe from concurrent scrape threads.
+
+    Returns:
+        sqlite3.Connection: Connection to the cache database.
+    """
+    conn = sqlite3.connect(SCRAPE_CACHE_PATH, timeout=10)
+    conn.execute("CREATE TABLE IF NOT EXISTS scrape_cache (key TEXT PRIMARY KEY, created REAL, data BLOB)")
+    return conn
+
+def _scrape_cache_key(query: str, start_ts: float, end_ts: float, max_results: int) -> str:
+    """
+    Builds the on-disk cache key for a scrape.
+
+    Args:
+        query (str): The search query for Google News.
+        start_ts (float): The start date for the news articles, as a POSIX timestamp.
+        end_ts (float): The end date for the news articles, as a POSIX timestamp.
+        max_results (int): Maximum number of news results to return.
+
+    Returns:
+        str: Hex digest identifying the query, date range and result limit.
+    """
+    return hashlib.sha1(f"{query}|{start_ts}|{end_ts}|{max_results}".encode('utf-8')).hexdigest()
+
+def load_cached_scrape(key: str, ttl: float = SCRAPE_CACHE_TTL):
+    """
+    Loads a previously stored scrape from the on-disk cache.
+
+    Args:
+        key (str): The cache key from _scrape_cache_key.
+        ttl (float): Maximum age of the entry in seconds.
+
+    Returns:
+        pd.DataFrame | None: The cached DataFrame, or None if missing, expired or unreadable.
+    """
+    try:
+        with closing(_open_scrape_cache()) as conn:
+            row = conn.execute("SELECT created, data FROM scrape_cache WHERE key = ?", (key,)).fetchone()
+        if row and time.time() - row[0] < ttl:
+            return pickle.loads(row[1])
+    except Exception as e:
+        logging.warning(f"Could not read scrape cache: {e}")
+    return None
+
+def store_cached_scrape(key: str, news_df: pd.DataFrame):
+    """
+    Stores a scrape in the on-disk cache, pruning expired entries in the same transaction.
+
+    Args:
+        key (str): The cache key from _scrape_cache_key.
+        news_df (pd.DataFrame): The scraped news data.
+    """
+    try:
+        with closing(_open_scrape_cache()) as conn, conn:
+            now = time.time()
+            conn.execute("DELETE FROM scrape_cache WHERE created < ?", (now - SCRAPE_CACHE_TTL,))
+            conn.execute(
+                "INSERT OR REPLACE INTO scrape_cache VALUES (?, ?, ?)",
+                (key, now, pickle.dumps(news_df, protocol=5))
+            )
+    except Exception as e:
+        logging.warning(f"Could not write scrape cache: {e}")
+
+def clear_scrape_cache():
+    """
+    Removes every entry from the on-disk scrape cache.
+    """
+    try:
+        with closing(_open_scrape_cache()) as conn, conn:
+            conn.execute("DELETE FROM scrape_cache")
+    except Exception as e:
+        logging.warning(f"Could not clear scrape cache: {e}")
+
+@st.cache_resource
+def get_http_session() -> requests.Session:
+    """
+    Returns the process-wide HTTP session, so repeated scrapes reuse keep-alive
+    connections to Google News. Cached as a resource because Streamlit re-executes
+    this module on every rerun. 429s are left to GNews, which has its own backoff.
+
+    Returns:
+        requests.Session: Session with a pooled, retrying HTTPS adapter.
+    """
+    session = requests.Session()
+    session.headers['User-Agent'] = USER_AGENT
+    session.mount('https://', HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504), raise_on_status=False)
+    ))
+    return session
+
+class PooledGNews(GNews):
+    """
+    GNews client that downloads RSS feeds through the shared pooled HTTP session
+    instead of opening a new connection for every request, and resolves article
+    links concurrently. Overrides private GNews hooks, so gnews is pinned to the
+    release they were written against (0.8.3).
+    """
+
+    @staticmethod
+    def _clean(description: str) -> str:
+        """
+        Strips the HTML markup from an RSS item description.
+
+        Args:
+            description (str): The description HTML.
+
+        Returns:
+            str: The description text.
+        """
+        # Same text as GNews's BeautifulSoup get_text(), without building a parse tree per item
+        text = SCRIPT_STYLE_RE.sub('', description)
+        text = TAG_RE.sub('', text)
+        return html.unescape(text).replace('\xa0', ' ')
+
+    def _fetch_feed(self, url: str):
+        """
+        Fetches and parses an RSS feed.
+
+        Args:
+            url (str): The feed URL.
+
+        Returns:
+            feedparser.FeedParserDict: The parsed feed, with the HTTP status set.
+        """
+        # Proxied requests keep going through GNews's own urllib handler
+        if self.proxy:
+            return super()._fetch_feed(url)
+        response = get_http_session().get(url, timeout=10)
+        # GNews backs off on 429 itself; any other error status must raise (GNews wraps it
+        # in NetworkError) rather than parse as an empty feed that would then be cached
+        if response.status_code != 429:
+            response.raise_for_status()
+        feed = feedparser.parse(response.content)
+        feed['status'] = response.status_code
+        return feed
+
+    def _process(self, item: dict):
+        """
+        Converts an RSS item into an article, leaving its link unresolved.
+
+        Args:
+            item (dict): The feedparser entry.
+
+        Returns:
+            dict | None: The article, or None if its source is an excluded website.
+        """
+        # Same as GNews's process_url exclusion check; the per-article link resolution
+        # it would do next is batched in get_news instead
+        source = item.get('source').get('href')
+        if any(re.match(f'^http(s)?://(www.)?{website.lower()}.*', source) for website in self._exclude_websites):
+            return None
+        return {
+            'title': item.get("title", ""),
+            'description': self._clean(item.get("description", "")),
+            'published date': item.get("published", ""),
+            'url': item.get('link'),
+            'publisher': item.get("source", " ")
+        }
+
+    def _resolve_url(self, url: str) -> str:
+        """
+        Resolves a Google News redirect link to the article URL with GNews's resolve_url.
+
+        Args:
+            url (str): The article link from the feed.
+
+        Returns:
+            str: The resolved URL, or the link itself if it cannot be resolved.
+        """
+        if not re.match(GOOGLE_NEWS_REGEX, url):
+            return url
+        # GNews falls back to a HEAD request here, but news.google.com answers it with the
+        # JavaScript redirect page rather than an HTTP redirect, so it only costs a round trip
+        return resolve_url(url, proxies=self._proxy)
+
+    def get_news(self, key: str, page: int = 1) -> list:
+        """
+        Searches Google News and resolves the article links concurrently, instead of
+        one browser launch per article in turn. Without playwright the RSS links are kept.
+
+        Overrides get_news rather than _get_news: GNews only honours the date range
+        when _get_news is called directly from get_news.
+
+        Args:
+            key (str): The search query.
+            page (int): The results page, for the SearchAPI backend.
+
+        Returns:
+            list: The articles.
+        """
+        articles = super().get_news(key, page)
+        if articles and PLAYWRIGHT_AVAILABLE:
+            resolved_urls = get_url_resolver().map(self._resolve_url, [article['url'] for article in articles])
+            for article, url in zip(articles, resolved_urls):
+                article['url'] = url
+        return articles
+
+@st.cache_resource
+def get_url_resolver() -> ThreadPoolExecutor:
+    """
+    Returns the process-wide pool that resolves article links. Shared by every scrape,
+    so concurrent queries and sessions never run more than URL_RESOLVE_WORKERS
+    headless browsers at once.
+
+    Returns:
+        ThreadPoolExecutor: The link resolution pool.
+    """
+    return ThreadPoolExecutor(max_workers=URL_RESOLVE_WORKERS, thread_name_prefix='url-resolver')
+
+@st.cache_resource(max_entries=64)
+def get_gnews_client(language: str, country: str, max_results: int, start_ts: float, end_ts: float) -> PooledGNews:
+    """
+    Returns a shared GNews client for the given configuration.
+
+    The client is keyed on its full configuration rather than mutated per call,
+    since concurrent scrapes (multiple queries, multiple sessions) share it.
+
+    Args:
+        language (str): The news language.
+        country (str): The news country.
+        max_results (int): Maximum number of news results to return.
+        start_ts (float): The start date for the news articles, as a POSIX timestamp.
+        end_ts (float): The end date for the news articles, as a POSIX timestamp.
+
+    Returns:
+        PooledGNews: The configured client.
+    """
+    client = PooledGNews(language=language, country=country, max_results=max_results)
+    client.start_date = datetime.fromtimestamp(start_ts)
+    client.end_date = datetime.fromtimestamp(end_ts)
+    return client
+
+def _parse_publisher(publisher_info) -> dict:
+    """
+    Normalizes a single 'publisher' entry from GNews into a dictionary.
+
+    Args:
+        publisher_info (dict | str): The publisher information, either as a dict or a JSON string.
+
+    Returns:
+        dict: The publisher dictionary, or an empty dict if it cannot be parsed.
+    """
+    if isinstance(publisher_info, dict):
+        return publisher_info
+    if isinstance(publisher_info, str):
+        try:
+            publisher_dict = json_loads(publisher_info)
+        except json.JSONDecodeError as jde:
+            logging.error(f"JSON decode error for publisher info: {jde}")
+            return {}
+        if not isinstance(publisher_dict, dict):
+            logging.error(f"Publisher info is not a JSON object: {publisher_info!r}")
+            return {}
+        return publisher_dict
+    logging.error(f"Unknown format for publisher information: {type(publisher_info).__name__}")
+    return {}
+
+def _compact_dtypes(news_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Stores publisher columns as categories, since publishers repeat heavily across
+    articles, and free-text columns as (Arrow-backed, when available) strings.
+
+    Args:
+        news_df (pd.DataFrame): DataFrame containing news articles.
+
+    Returns:
+        pd.DataFrame: The same DataFrame with compacted column dtypes.
+    """
+    for col in ('name_of_publisher', 'url_of_publisher'):
+        if col in news_df.columns:
+            news_df[col] = news_df[col].astype('category')
+    for col in ('title', 'description', 'url'):
+        if col in news_df.columns:
+            news_df[col] = news_df[col].astype(STRING_DTYPE)
+    return news_df
+
+@st.cache_data(ttl=SCRAPE_MEMORY_TTL, max_entries=256, show_spinner=False)
+def _scrape_google_news_uncached(query: str, start_ts: float, end_ts: float, max_results: int) -> pd.DataFrame:
+    """
+    Fetches and parses Google News results. Memoized in memory by Streamlit and on
+    disk in SCRAPE_CACHE_PATH, so identical queries within the TTL skip the network
+    entirely, even after an app restart. A disk hit is memoized again for
+    SCRAPE_MEMORY_TTL, so only entries young enough to stay within SCRAPE_CACHE_TTL
+    are taken from disk.
+
+    Dates are passed as POSIX timestamps to keep the cache key cheap to hash.
+    Errors are raised rather than reported so that failures are never cached.
+
+    Args:
+        query (str): The search query for Google News.
+        start_ts (float): The start date for the news articles, as a POSIX timestamp.
+        end_ts (float): The end date for the news articles, as a POSIX timestamp.
+        max_results (int): Maximum number of news results to return.
+
+    Returns:
+        pd.DataFrame: DataFrame containing the scraped and processed news data.
+    """
+    cache_key = _scrape_cache_key(query, start_ts, end_ts, max_results)
+    cached_df = load_cached_scrape(cache_key, ttl=SCRAPE_CACHE_TTL - SCRAPE_MEMORY_TTL)
+    if cached_df is not None:
+        logging.info(f"Loaded {len(cached_df)} articles for query '{query}' from the scrape cache.")
+        return cached_df
+
+    google_news = get_gnews_client('en', 'US', max_results, start_ts, end_ts)
+
+    result = google_news.get_news(query)
+    if not result:
+        logging.warning("No news articles found for the given query and date range.")
+        return pd.DataFrame()
+
+    # Log the columns received
+    received_columns = list(result[0].keys())
+    logging.info(f"Columns received from GNews: {received_columns}")
+
+    # Build the frame with an explicit column list: skips per-record schema inference and
+    # leaves out anything the app does not use before it is parsed, cached and rendered
+    columns = [col for col in GNEWS_COLUMNS if col in received_columns]
+    unused_columns = [col for col in received_columns if col not in GNEWS_COLUMNS]
+    if unused_columns:
+        logging.info(f"Dropped unused columns: {unused_columns}")
+    news_df = pd.DataFrame.from_records(result, columns=columns)
+
+    # Parse 'published date' to datetime for accurate sorting
+    if 'published date' in news_df.columns:
+        # Normalize to naive UTC: Excel export cannot hold timezone-aware datetimes
+        # GNews dates are RFC 822 strings; parse them with the fixed format and only send
+        # anything that does not match through the much slower per-element 'mixed' inference
+        raw_published = news_df['published date']
+        published = pd.to_datetime(raw_published, format=RSS_DATE_FORMAT, errors='coerce', utc=True)
+        unparsed = published.isna() & raw_published.notna()
+        if unparsed.any():
+            published[unparsed] = pd.to_datetime(raw_published[unparsed], errors='coerce', utc=True, format='mixed')
+        # Filter and sort the date column alone, then reorder the frame with a single selection
+        # instead of copying it once to drop invalid rows and again to sort.
+        # RSS items arrive mostly in date order, which a stable sort handles cheaply and keeps ties in feed order
+        published = published.dropna().dt.tz_localize(None).sort_values(ascending=False, kind='stable')
+        dropped_count = len(news_df) - len(published)
+        if dropped_count > 0:
+            logging.warning(f"Dropped {dropped_count} articles due to invalid 'published date'.")
+        news_df = news_df.reindex(published.index)
+        news_df['published date'] = published
+        news_df.index = pd.RangeIndex(len(news_df))
+        logging.info(f"Successfully scraped and sorted {len(news_df)} articles by published date.")
+    else:
+        logging.warning("'published date' column not found in the scraped data. Skipping sorting.")
+
+    # Parse 'publisher' information
+    if 'publisher' in news_df.columns:
+        # pop() removes the raw column in place rather than copying the frame to drop it
+        publisher_dicts = news_df.pop('publisher')
+        # GNews already yields dicts, so per-entry normalization is only needed for stray JSON strings
+        if not all(isinstance(publisher_info, dict) for publisher_info in publisher_dicts):
+            publisher_dicts = publisher_dicts.map(_parse_publisher)
+        # Extract both fields with a single frame construction
+        publisher_fields = pd.DataFrame.from_records(
+            publisher_dicts.tolist(), columns=['href', 'title'], index=publisher_dicts.index
+        )
+        news_df['url_of_publisher'] = publisher_fields['href']
+        news_df['name_of_publisher'] = publisher_fields['title']
+
+        logging.info("Successfully parsed publisher information into separate columns.")
+    else:
+        logging.warning("'publisher' column not found in the scraped data. Skipping publisher parsing.")
+
+    news_df = _compact_dtypes(news_df)
+    store_cached_scrape(cache_key, news_df)
+    return news_df
 
 def scrape_google_news(query: str, start_date: datetime, end_date: datetime, max_results: int) -> pd.DataFrame:
     """
@@ -40,113 +485,182 @@ def scrape_google_news(query: str, start_date: datetime, end_date: datetime, max
     """
     logging.info(f"Starting news scrape for query: '{query}' from {start_date.date()} to {end_date.date()} with max results {max_results}")
     try:
-        google_news = GNews(language='en', country='US', max_results=max_results)
-        google_news.start_date = start_date
-        google_news.end_date = end_date
-
-        result = google_news.get_news(query)
-        if not result:
-            logging.warning("No news articles found for the given query and date range.")
-            return pd.DataFrame()
-
-        news_df = pd.DataFrame(result)
-
-        # Log the columns received
-        logging.info(f"Columns received from GNews: {news_df.columns.tolist()}")
-
-        # Parse 'published date' to datetime for accurate sorting
-        if 'published date' in news_df.columns:
-            news_df['published date'] = pd.to_datetime(news_df['published date'], errors='coerce')
-            initial_count = len(news_df)
-            news_df = news_df.dropna(subset=['published date'])
-            dropped_count = initial_count - len(news_df)
-            if dropped_count > 0:
-                logging.warning(f"Dropped {dropped_count} articles due to invalid 'published date'.")
-            news_df = news_df.sort_values(by='published date', ascending=False)
-            logging.info(f"Successfully scraped and sorted {len(news_df)} articles by published date.")
-        else:
-            logging.warning("'published date' column not found in the scraped data. Skipping sorting.")
-
-        # Parse 'publisher' information
-        if 'publisher' in news_df.columns:
-            # Initialize new columns
-            news_df['url_of_publisher'] = None
-            news_df['name_of_publisher'] = None
-
-            for index, row in news_df.iterrows():
-                publisher_info = row['publisher']
-                try:
-                    # If publisher_info is a string, parse it as JSON
-                    if isinstance(publisher_info, str):
-                        publisher_dict = json.loads(publisher_info)
-                    elif isinstance(publisher_info, dict):
-                        publisher_dict = publisher_info
-                    else:
-                        raise ValueError("Unknown format for publisher information.")
-
-                    # Extract 'href' and 'title'
-                    url = publisher_dict.get('href', None)
-                    name = publisher_dict.get('title', None)
-
-                    news_df.at[index, 'url_of_publisher'] = url
-                    news_df.at[index, 'name_of_publisher'] = name
-                except json.JSONDecodeError as jde:
-                    logging.error(f"JSON decode error for publisher info at index {index}: {jde}")
-                except Exception as e:
-                    logging.error(f"Unexpected error parsing publisher info at index {index}: {e}")
-
-            # Optional: Drop the original 'publisher' column if no longer needed
-            news_df = news_df.drop(columns=['publisher'])
-            logging.info("Successfully parsed publisher information into separate columns.")
-        else:
-            logging.warning("'publisher' column not found in the scraped data. Skipping publisher parsing.")
-
-        return news_df
+        return _scrape_google_news_uncached(query, start_date.timestamp(), end_date.timestamp(), max_results)
     except Exception as e:
         logging.error(f"Error scraping Google News: {e}", exc_info=True)
         st.error(f"An error occurred while scraping news: {e}")
         return pd.DataFrame()
 
-def configure_sidebar() -> dict:
+async def _scrape_many(queries: list, start_ts: float, end_ts: float, max_results: int) -> list:
     """
-    Configures the Streamlit sidebar for user inputs.
+    Runs one scrape per query concurrently, each on its own worker thread.
+
+    Args:
+        queries (list): The search queries for Google News.
+        start_ts (float): The start date for the news articles, as a POSIX timestamp.
+        end_ts (float): The end date for the news articles, as a POSIX timestamp.
+        max_results (int): Maximum number of news results to return per query.
 
     Returns:
-        dict: A dictionary containing all user inputs.
+        list: One DataFrame or raised exception per query, in query order.
+    """
+    return await asyncio.gather(
+        *(asyncio.to_thread(_scrape_google_news_uncached, query, start_ts, end_ts, max_results) for query in queries),
+        return_exceptions=True
+    )
+
+def scrape_google_news_multi(queries: list, start_date: datetime, end_date: datetime, max_results: int) -> pd.DataFrame:
+    """
+    Scrapes Google News for several queries at once and merges the results.
+
+    Args:
+        queries (list): The search queries for Google News.
+        start_date (datetime): The start date for the news articles.
+        end_date (datetime): The end date for the news articles.
+        max_results (int): Maximum number of news results to return per query.
+
+    Returns:
+        pd.DataFrame: DataFrame containing the merged news data, newest first and without duplicate articles.
 
     Example:
-        >>> user_inputs = configure_sidebar()
-        >>> print(user_inputs)
-        {'query': 'Technology', 'start_date': datetime.datetime(2022, 10, 31, 0, 0), ...}
+        >>> df = scrape_google_news_multi(["AI", "Robotics"], datetime(2023, 1, 1), datetime(2023, 12, 31), 10)
     """
-    st.sidebar.header("Google News Scraper Configuration")
+    # Repeated queries would only fetch the same feed again, so drop them before any network call
+    queries = list(dict.fromkeys(queries))
+    if len(queries) <= 1:
+        return scrape_google_news(queries[0] if queries else "", start_date, end_date, max_results)
+
+    logging.info(f"Starting concurrent news scrape for queries: {queries} from {start_date.date()} to {end_date.date()} with max results {max_results}")
+    results = asyncio.run(_scrape_many(queries, start_date.timestamp(), end_date.timestamp(), max_results))
+
+    frames = []
+    for query, result in zip(queries, results):
+        if isinstance(result, Exception):
+            logging.error(f"Error scraping Google News for query '{query}': {result}", exc_info=result)
+            st.error(f"An error occurred while scraping news for '{query}': {result}")
+        elif not result.empty:
+            frames.append(result)
+
+    if not frames:
+        return pd.DataFrame()
 
-    query = st.sidebar.text_input("Search Query", value="Artificial Intelligence")
-    
+    news_df = pd.concat(frames, ignore_index=True)
+    if 'url' in news_df.columns:
+        news_df = news_df.drop_duplicates(subset=['url'])
+    if 'published date' in news_df.columns:
+        news_df = news_df.sort_values(by='published date', ascending=False, kind='stable', ignore_index=True)
+    # Concatenating categoricals with different categories falls back to object dtype
+    return _compact_dtypes(news_df)
+
+def default_date_range() -> tuple:
+    """
+    Computes the default sidebar date range: from one year before tomorrow until tomorrow.
+
+    Returns:
+        tuple: The default start and end dates, as datetime.date objects.
+    """
     # Calculate tomorrow's date
     today = datetime.today()
     tomorrow = today + timedelta(days=1)
     # Calculate start date as one year before tomorrow
     one_year = timedelta(days=365)
     start_date_default = tomorrow - one_year
+    return start_date_default.date(), tomorrow.date()
 
-    st.sidebar.subheader("Date Range")
-    # Use date_input for better user experience
-    start_date = st.sidebar.date_input(
-        "Start Date",
-        value=start_date_default.date(),
-        min_value=datetime(2000, 1, 1).date(),
-        max_value=tomorrow.date()
-    )
-    
-    end_date = st.sidebar.date_input(
-        "End Date",
-        value=tomorrow.date(),
-        min_value=start_date,
-        max_value=tomorrow.date()
+def _warm_scrape_cache(queries: tuple, start_ts: float, end_ts: float, max_results: int):
+    """
+    Scrapes the given queries to populate the scrape caches. Failures are only logged,
+    since nobody is waiting on the result.
+
+    Args:
+        queries (tuple): The search queries to prefetch.
+        start_ts (float): The start date for the news articles, as a POSIX timestamp.
+        end_ts (float): The end date for the news articles, as a POSIX timestamp.
+        max_results (int): Maximum number of news results to return.
+    """
+    for query in queries:
+        try:
+            _scrape_google_news_uncached(query, start_ts, end_ts, max_results)
+        except Exception as e:
+            logging.warning(f"Cache warm-up failed for query '{query}': {e}")
+    logging.info(f"Finished warming the scrape cache for {len(queries)} queries.")
+
+@st.cache_resource(ttl=SCRAPE_CACHE_TTL - SCRAPE_MEMORY_TTL)
+def start_cache_warmer() -> threading.Thread:
+    """
+    Prefetches WARM_QUERIES with the default sidebar settings on a background thread,
+    so the first click on a popular query is served from the cache. Runs once per
+    process and again on the first rerun after the disk cache has stopped serving
+    the warmed results (SCRAPE_CACHE_TTL - SCRAPE_MEMORY_TTL).
+
+    Returns:
+        threading.Thread: The started warm-up thread.
+    """
+    start_date, end_date = default_date_range()
+    thread = threading.Thread(
+        target=_warm_scrape_cache,
+        args=(
+            WARM_QUERIES,
+            datetime.combine(start_date, datetime.min.time()).timestamp(),
+            datetime.combine(end_date, datetime.max.time()).timestamp(),
+            DEFAULT_MAX_RESULTS
+        ),
+        name="scrape-cache-warmer",
+        daemon=True
     )
+    thread.start()
+    return thread
+
+def configure_sidebar() -> dict:
+    """
+    Configures the Streamlit sidebar for user inputs.
+
+    Returns:
+        dict: A dictionary containing all user inputs, and whether the form was just submitted.
+
+    Example:
+        >>> user_inputs = configure_sidebar()
+        >>> print(user_inputs)
+        {'query': 'Technology', 'start_date': datetime.datetime(2022, 10, 31, 0, 0), ..., 'submitted': False}
+    """
+    st.sidebar.header("Google News Scraper Configuration")
+
+    start_date_default, tomorrow = default_date_range()
 
-    max_results = st.sidebar.slider("Maximum Results", min_value=1, max_value=100, value=10, step=1)
+    # Inputs inside a form are only sent on submit, so tweaking several
+    # settings costs a single rerun instead of one per widget change.
+    # Submitting the form is what starts a scrape, so edits are never left unapplied.
+    with st.sidebar.form("config_form", clear_on_submit=False):
+        query = st.text_input(
+            "Search Query",
+            value=DEFAULT_QUERY,
+            help="Separate multiple queries with commas to scrape them concurrently."
+        )
+
+        st.subheader("Date Range")
+        # Use date_input for better user experience
+        start_date = st.date_input(
+            "Start Date",
+            value=start_date_default,
+            min_value=datetime(2000, 1, 1).date(),
+            max_value=tomorrow
+        )
+
+        # min_value cannot follow the start date before submit, so the range is checked below
+        end_date = st.date_input(
+            "End Date",
+            value=tomorrow,
+            min_value=datetime(2000, 1, 1).date(),
+            max_value=tomorrow
+        )
+
+        max_results = st.slider("Maximum Results", min_value=1, max_value=100, value=DEFAULT_MAX_RESULTS, step=1)
+
+        submitted = st.form_submit_button("Scrape News")
+
+    if end_date < start_date:
+        st.sidebar.warning("End Date is before Start Date; using Start Date as End Date.")
+        end_date = start_date
 
     # Convert date inputs to datetime objects
     start_datetime = datetime.combine(start_date, datetime.min.time())
@@ -156,7 +670,8 @@ def configure_sidebar() -> dict:
         "query": query,
         "start_date": start_datetime,
         "end_date": end_datetime,
-        "max_results": max_results
+        "max_results": max_results,
+        "submitted": submitted
     }
 
 def make_clickable(val):
@@ -189,22 +704,115 @@ def make_name_clickable(name, url):
     else:
         return 'N/A'
 
-def convert_df_to_excel(df: pd.DataFrame) -> BytesIO:
+@st.cache_data(show_spinner=False)
+def convert_df_to_csv(df: pd.DataFrame) -> bytes:
+    """
+    Converts a DataFrame to UTF-8 encoded CSV bytes, using pyarrow's native CSV
+    writer when available and falling back to pandas otherwise.
+
+    Both writers format dates the same way. pyarrow quotes the header and every
+    string field, while pandas quotes only the fields that need it; any CSV reader
+    parses the two identically.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to convert.
+
+    Returns:
+        bytes: The CSV file contents.
+    """
+    if pa is not None:
+        try:
+            # pyarrow would write timestamps with microseconds ("2024-01-02 10:00:00.000000");
+            # cast them to text first so they read like the pandas export
+            datetime_columns = df.select_dtypes(include='datetime').columns
+            df_text_dates = df.assign(**{col: df[col].astype('string') for col in datetime_columns})
+            output = BytesIO()
+            pa_csv.write_csv(pa.Table.from_pandas(df_text_dates, preserve_index=False), output)
+            return output.getvalue()
+        except pa.ArrowException as e:
+            logging.warning(f"pyarrow CSV export failed, falling back to pandas: {e}")
+    output = BytesIO()
+    df.to_csv(output, index=False, encoding='utf-8')
+    return output.getvalue()
+
+@st.cache_data(show_spinner=False)
+def convert_df_to_parquet(df: pd.DataFrame) -> bytes:
+    """
+    Converts a DataFrame to a Parquet file in memory. Requires pyarrow.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to convert.
+
+    Returns:
+        bytes: The in-memory Parquet file.
+    """
+    output = BytesIO()
+    df.to_parquet(output, engine='pyarrow', index=False)
+    return output.getvalue()
+
+@st.cache_data(show_spinner=False)
+def convert_df_to_excel(df: pd.DataFrame) -> bytes:
     """
-    Converts a DataFrame to an Excel file in memory.
+    Converts a DataFrame to an Excel file in memory. Cached on the DataFrame contents,
+    so repeated downloads of the same results reuse the generated bytes.
 
     Args:
         df (pd.DataFrame): The DataFrame to convert.
 
     Returns:
-        BytesIO: The in-memory Excel file.
+        bytes: The in-memory Excel file.
     """
     output = BytesIO()
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
-        df.to_excel(writer, index=False, sheet_name='Google News')
+    # constant_memory flushes each row as soon as the next one starts, so rows must be
+    # written strictly in order. pandas' ExcelWriter emits cells column by column, which
+    # would silently drop data in this mode, hence writing the rows directly.
+    workbook = xlsxwriter.Workbook(output, {
+        'constant_memory': True,
+        'default_date_format': 'yyyy-mm-dd hh:mm:ss',
+        # Skip the per-cell URL detection; cells are written as plain text like the original openpyxl export
+        'strings_to_urls': False
+    })
+    worksheet = workbook.add_worksheet('Google News')
+    header_format = workbook.add_format({'bold': True, 'border': 1})
+    worksheet.write_row(0, 0, [str(col) for col in df.columns], header_format)
+    # xlsxwriter cannot write NaN/NaT/pd.NA, so blank them out first
+    values = df.astype(object).where(df.notna(), None)
+    for row_number, row in enumerate(values.itertuples(index=False, name=None), start=1):
+        worksheet.write_row(row_number, 0, row)
+    workbook.close()
     processed_data = output.getvalue()
     return processed_data
 
+@st.cache_data(show_spinner=False)
+def render_html_table(df: pd.DataFrame, escape_columns: tuple = ('title', 'description')) -> str:
+    """
+    Renders a DataFrame as an HTML table. Cached on the DataFrame contents,
+    so reruns that show the same results skip the HTML conversion.
+
+    Cells are joined directly rather than going through DataFrame.to_html,
+    whose generic per-cell formatter dominates the cost for a plain table.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to render, with HTML-safe link columns.
+        escape_columns (tuple): Plain-text columns to HTML-escape.
+
+    Returns:
+        str: The HTML table.
+    """
+    columns = []
+    for col in df.columns:
+        values = df[col].astype('string').fillna('')
+        if col in escape_columns:
+            values = values.map(html.escape)
+        columns.append(values.tolist())
+
+    header = ''.join(f'<th>{html.escape(str(col))}</th>' for col in df.columns)
+    body = ''.join(
+        '<tr>' + ''.join(f'<td>{value}</td>' for value in row) + '</tr>'
+        for row in zip(*columns)
+    )
+    return f'<table class="dataframe"><thead><tr>{header}</tr></thead><tbody>{body}</tbody></table>'
+
 def display_news_data(news_df: pd.DataFrame):
     """
     Displays the scraped news data in the Streamlit app with clickable links.
@@ -219,29 +827,54 @@ def display_news_data(news_df: pd.DataFrame):
         st.info("No news articles to display.")
         return
 
-    # Create clickable links
-    if 'url' in news_df.columns:
-        news_df['url'] = news_df['url'].apply(make_clickable)
+    # Reruns that show the same results (e.g. after a download click) reuse the rendered
+    # artifacts stored in session_state instead of rebuilding links and HTML
+    render_key = int(pd.util.hash_pandas_object(news_df, index=False).sum())
+    rendered = st.session_state.get('_rendered')
+    if rendered and rendered[0] == render_key:
+        _, news_df, html_df = rendered
     else:
-        logging.warning("'url' column not found in DataFrame.")
+        # The caller keeps this frame across reruns, so the link columns are collected
+        # here and swapped in with assign(), which shares the untouched columns
+        # instead of deep-copying the whole frame
+        link_columns = {}
+
+        # Create clickable links
+        if 'url' in news_df.columns:
+            # Vectorized equivalent of make_clickable over the whole column
+            # Feed text, so escape it before it goes into the href attribute
+            url = news_df['url'].astype('string').fillna('').map(html.escape)
+            link_columns['url'] = ('<a href="' + url + '" target="_blank">Link</a>').where(url != '', 'N/A')
+        else:
+            logging.warning("'url' column not found in DataFrame.")
+
+        if 'url_of_publisher' in news_df.columns and 'name_of_publisher' in news_df.columns:
+            # Vectorized equivalent of make_name_clickable over the whole column
+            # Feed text, so escape both before they are built into the link markup
+            name = news_df['name_of_publisher'].astype('string').fillna('').map(html.escape)
+            publisher_url = news_df['url_of_publisher'].astype('string').fillna('').map(html.escape)
+            linked = ('<a href="' + publisher_url + '" target="_blank">' + name + '</a>')
+            link_columns['name_of_publisher'] = linked.where(
+                (name != '') & (publisher_url != ''),
+                name.where(name != '', 'N/A')
+            )
+        else:
+            logging.warning("'url_of_publisher' or 'name_of_publisher' columns not found in DataFrame.")
 
-    if 'url_of_publisher' in news_df.columns and 'name_of_publisher' in news_df.columns:
-        news_df['name_of_publisher'] = news_df.apply(
-            lambda row: make_name_clickable(row['name_of_publisher'], row['url_of_publisher']),
-            axis=1
-        )
-    else:
-        logging.warning("'url_of_publisher' or 'name_of_publisher' columns not found in DataFrame.")
+        news_df = news_df.assign(**link_columns)
 
-    # Select columns to display
-    display_columns = ['published date', 'title', 'description', 'url', 'name_of_publisher']
+        # Select columns to display
+        display_columns = ['published date', 'title', 'description', 'url', 'name_of_publisher']
 
-    # Verify that all display columns exist
-    missing_columns = [col for col in display_columns if col not in news_df.columns]
-    if missing_columns:
-        st.error(f"The following required columns are missing from the data: {', '.join(missing_columns)}")
-        logging.error(f"Missing columns in DataFrame: {missing_columns}")
-        return
+        # Verify that all display columns exist
+        missing_columns = [col for col in display_columns if col not in news_df.columns]
+        if missing_columns:
+            st.error(f"The following required columns are missing from the data: {', '.join(missing_columns)}")
+            logging.error(f"Missing columns in DataFrame: {missing_columns}")
+            return
+
+        html_df = render_html_table(news_df[display_columns])
+        st.session_state['_rendered'] = (render_key, news_df, html_df)
 
     # Convert DataFrame to HTML with styling
     table_style = """
@@ -271,27 +904,33 @@ def display_news_data(news_df: pd.DataFrame):
     # Apply styling
     st.markdown(table_style, unsafe_allow_html=True)
     st.markdown("### Scraped News Articles", unsafe_allow_html=True)
-    html_df = news_df[display_columns].to_html(escape=False, index=False)
     st.markdown(html_df, unsafe_allow_html=True)
 
-    # Download as CSV
-    csv = news_df.to_csv(index=False)
+    # Download as CSV (generated only when the button is clicked)
     st.download_button(
         label="Download Data as CSV",
-        data=csv,
+        data=lambda: convert_df_to_csv(news_df),
         file_name='google_news_results.csv',
         mime='text/csv'
     )
 
-    # Download as Excel
-    excel_data = convert_df_to_excel(news_df)
+    # Download as Excel (generated only when the button is clicked)
     st.download_button(
         label="Download Data as Excel",
-        data=excel_data,
+        data=lambda: convert_df_to_excel(news_df),
         file_name='google_news_results.xlsx',
         mime='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
     )
 
+    # Download as Parquet (needs pyarrow; generated only when the button is clicked)
+    if pa is not None:
+        st.download_button(
+            label="Download Data as Parquet",
+            data=lambda: convert_df_to_parquet(news_df),
+            file_name='google_news_results.parquet',
+            mime='application/vnd.apache.parquet'
+        )
+
 def main():
     """
     The main function to run the Streamlit app.
@@ -299,18 +938,27 @@ def main():
     st.set_page_config(page_title="Google News Scraper", layout="wide")
     st.title("📰 Google News Scraper")
 
+    start_cache_warmer()
+
     user_inputs = configure_sidebar()
 
-    if st.button("Scrape News"):
+    # Let users force fresh results instead of waiting for the cache TTL
+    if st.sidebar.button("Clear cache"):
+        _scrape_google_news_uncached.clear()
+        clear_scrape_cache()
+        st.sidebar.success("Cache cleared.")
+
+    if user_inputs["submitted"]:
         with st.spinner("Scraping news articles..."):
-            news_df = scrape_google_news(
-                query=user_inputs["query"],
+            queries = [q.strip() for q in user_inputs["query"].split(",") if q.strip()]
+            news_df = scrape_google_news_multi(
+                queries=queries,
                 start_date=user_inputs["start_date"],
                 end_date=user_inputs["end_date"],
                 max_results=user_inputs["max_results"]
             )
-        
-        display_news_data(news_df)
+        # Keep the results so later reruns (downloads, sidebar changes) still show them
+        st.session_state['news_df'] = news_df
 
         # Optionally, save to SQLite or CSV
         # Uncomment the following lines to enable saving
@@ -320,5 +968,8 @@ def main():
         # conn.close()
         # st.success("Data saved to SQLite database.")
 
+    if 'news_df' in st.session_state:
+        display_news_data(st.session_state['news_df'])
+
 if __name__ == "__main__":
     main()
\ No newline at end of file